@@ -7,9 +7,10 @@ from exceptions import CantMoveThereError, CantBuildThereError, InvalidSymbolErr
 
 class GameManager:
     """Class for setting up the game requirements and functionalities"""
-    def __init__(self, white_player_type='human', blue_player_type='human', undo_redo='off', score_display='off'):
-        self.white_player = WhitePlayer(white_player_type)
-        self.blue_player = BluePlayer(blue_player_type)
+    def __init__(self, white_player_type='human', blue_player_type='human', undo_redo='off', score_display='off',
+                 white_weights=None, blue_weights=None):
+        self.white_player = WhitePlayer(white_player_type, white_weights)
+        self.blue_player = BluePlayer(blue_player_type, blue_weights)
         self.undo_redo = undo_redo
         self.score_display = score_display
 
@@ -249,13 +250,11 @@ class GameManager:
         return final_distance
 
     def move_score(self, curr_player, opponent):
-        """Calculates the move score using height, center, and distance"""
+        """Calculates the move score using height, center, and distance weighted by the player's weights"""
         height_score = self.height_score(curr_player)
         center_score = self.center_score(curr_player)
         distance_score = self.distance_score(curr_player, opponent)
-        c1 = 3
-        c2 = 2
-        c3 = 1
+        c1, c2, c3 = curr_player.weights
         move_score = c1*height_score + c2*center_score + c3*distance_score
         return move_score
 
@@ -271,7 +270,7 @@ class GameManager:
         """Heuristic player uses move_score to find best direction to move to"""
         trial_player = copy.deepcopy(self.current_player)
         trial_opp_player = self.get_opponent(trial_player)
-        best_score = 0
+        best_score = None
         best_direction = None
         worker_with_best_direction = None
         for worker in trial_player.workers:
@@ -285,7 +284,7 @@ class GameManager:
                     # Inflate the score if going to a specific cell gives heuristic player the win condition
                     if self.board.gameboard[worker.position[0]][worker.position[1]] == "3":
                         current_move_score = current_move_score * 10
-                    if current_move_score > best_score:
+                    if best_score is None or current_move_score > best_score:
                         best_direction = valid_direction
                         best_score = current_move_score
                         worker_with_best_direction = worker
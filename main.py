@@ -2,6 +2,7 @@
 import logging
 import sys
 from game_manager import GameManager
+from players import parse_weights
 from exceptions import (InvalidSymbolError,
                         InvalidWorkerError,
                         CantMoveThereError,
@@ -89,9 +90,19 @@ class MainCLI:
             score_display = sys.argv[4].lower()
         else:
             score_display = "off"
+        # Heuristic weights as "height,center,distance", e.g. 3,2,1
+        if len(sys.argv) > 5:
+            white_weights = parse_weights(sys.argv[5])
+        else:
+            white_weights = None
+        if len(sys.argv) > 6:
+            blue_weights = parse_weights(sys.argv[6])
+        else:
+            blue_weights = None
 
         # Create GameManager with parsed args:
-        self.game_manager = GameManager(white_player_type, blue_player_type, undo_redo, score_display)
+        self.game_manager = GameManager(white_player_type, blue_player_type, undo_redo, score_display,
+                                        white_weights, blue_weights)
         self.game_manager.save_state()
 
         display_score = bool(score_display == "on")
@@ -1,6 +1,17 @@
 """Initializes worker and player classes"""
 from exceptions import InvalidSymbolError, InvalidWorkerError
 
+# Heuristic move_score coefficients (height, center, distance)
+DEFAULT_WEIGHTS = (3, 2, 1)
+
+
+def parse_weights(weights_input):
+    """Turns a "c1,c2,c3" string into a tuple of three move_score coefficients"""
+    weights = tuple(float(value) for value in weights_input.split(","))
+    if len(weights) != 3:
+        raise ValueError("Weights need three values: height,center,distance")
+    return weights
+
 
 #----------------------WORKER CLASS----------------------
 
@@ -15,10 +26,12 @@ class Worker:
 
 class Player:
     """Builds the player class for white, blue, random and heursitic"""
-    def __init__(self, name, workers, player_type):
+    def __init__(self, name, workers, player_type, weights=None):
         self.name = name
         self.workers = workers
         self.player_type = player_type
+        # Coefficients used by the heuristic player's move_score
+        self.weights = tuple(weights) if weights is not None else DEFAULT_WEIGHTS
 
     def check_worker_input(self, worker_user_input):
         """Checks if the worker chosen is a valid worker"""
@@ -43,11 +56,11 @@ class Player:
 # White and Blue players inherit from Player
 class WhitePlayer(Player):
     """Creates an instance of white player"""
-    def __init__(self, player_type):
-        super().__init__("white", [Worker("A", [3, 1]), Worker("B", [1, 3])], player_type)
+    def __init__(self, player_type, weights=None):
+        super().__init__("white", [Worker("A", [3, 1]), Worker("B", [1, 3])], player_type, weights)
 
 
 class BluePlayer(Player):
     """Creates an instance of blue player"""
-    def __init__(self, player_type):
-        super().__init__("blue", [Worker("Y", [1, 1]), Worker("Z", [3, 3])], player_type)
+    def __init__(self, player_type, weights=None):
+        super().__init__("blue", [Worker("Y", [1, 1]), Worker("Z", [3, 3])], player_type, weights)
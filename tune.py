@@ -0,0 +1,189 @@
+"""Searches for stronger move_score weights by parallel self-play against a reference heuristic player"""
+import argparse
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from game_manager import GameManager
+from players import DEFAULT_WEIGHTS, parse_weights
+
+
+#----------------------SELF-PLAY----------------------
+
+def play_heuristic_game(white_weights, blue_weights, seed):
+    """Plays one silent heuristic vs heuristic game and returns the winner's name"""
+    random.seed(seed)
+    game_manager = GameManager('heuristic', 'heuristic', white_weights=white_weights, blue_weights=blue_weights)
+    while True:
+        current_player = game_manager.current_player
+        opponent = game_manager.get_opponent(current_player)
+        if game_manager.get_winner(current_player) is not False:
+            return current_player.name
+        if game_manager.get_winner(opponent) is not False:
+            return opponent.name
+        if game_manager.current_player_loses(current_player) is not False:
+            return opponent.name
+        game_manager.heuristic_find_best_move()
+        game_manager.turn_number += 1
+        game_manager.change_current_player()
+
+
+def play_match_game(task):
+    """Plays one game of a match; returns 1 if the candidate won, else 0"""
+    candidate_weights, reference_weights, seed, candidate_is_white = task
+    if candidate_is_white:
+        return int(play_heuristic_game(candidate_weights, reference_weights, seed) == "white")
+    return int(play_heuristic_game(reference_weights, candidate_weights, seed) == "blue")
+
+
+#----------------------TUNER----------------------
+
+def weights_key(weights):
+    """String key used to store a weight vector in the checkpoint"""
+    return ",".join(f"{value:g}" for value in weights)
+
+
+class WeightTuner:
+    """Scores candidate weights by self-play and keeps results in a resumable checkpoint"""
+    def __init__(self, reference_weights=DEFAULT_WEIGHTS, games=100, workers=None, seed=0,
+                 checkpoint_path="tune_checkpoint.json"):
+        self.reference_weights = tuple(reference_weights)
+        self.games = games
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.checkpoint_path = checkpoint_path
+        self.results = {}
+        self.spsa_state = None
+
+    def config(self):
+        """Settings that must match for a checkpoint to be reused"""
+        return {'reference': list(self.reference_weights), 'games': self.games, 'seed': self.seed}
+
+    def load_checkpoint(self):
+        """Loads earlier results so an interrupted run carries on where it stopped"""
+        if not os.path.exists(self.checkpoint_path):
+            return
+        with open(self.checkpoint_path, encoding="utf-8") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        if checkpoint['config'] != self.config():
+            raise ValueError(f"{self.checkpoint_path} was made with different settings: {checkpoint['config']}")
+        self.results = checkpoint['results']
+        self.spsa_state = checkpoint.get('spsa')
+        print(f"Resuming from {self.checkpoint_path} with {len(self.results)} evaluated candidates")
+
+    def save_checkpoint(self):
+        """Writes the checkpoint to a temporary file first so a crash never leaves it half written"""
+        checkpoint = {'config': self.config(), 'results': self.results, 'spsa': self.spsa_state}
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, indent=2)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def match_tasks(self, candidate_weights):
+        """Builds the games for one candidate, alternating colors so neither side always moves first"""
+        # Every candidate sees the same seeds, so candidates are compared on the same games
+        return [(tuple(candidate_weights), self.reference_weights, self.seed + game, game % 2 == 0)
+                for game in range(self.games)]
+
+    def evaluate(self, executor, candidates):
+        """Plays every unevaluated candidate's games in parallel and returns their win rates"""
+        pending = []
+        for candidate in candidates:
+            key = weights_key(candidate)
+            if key not in self.results and key not in [weights_key(other) for other in pending]:
+                pending.append(candidate)
+        if pending:
+            tasks = [task for candidate in pending for task in self.match_tasks(candidate)]
+            chunksize = max(1, len(tasks) // (self.workers * 4))
+            outcomes = list(executor.map(play_match_game, tasks, chunksize=chunksize))
+            for index, candidate in enumerate(pending):
+                wins = sum(outcomes[index * self.games:(index + 1) * self.games])
+                self.results[weights_key(candidate)] = {'weights': list(candidate), 'wins': wins,
+                                                        'games': self.games, 'win_rate': wins / self.games}
+                print(f"{weights_key(candidate)}: {wins}/{self.games}")
+        return [self.results[weights_key(candidate)]['win_rate'] for candidate in candidates]
+
+    def run_candidates(self, candidates):
+        """Evaluates a fixed list of candidates in batches, saving after each batch"""
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for start in range(0, len(candidates), self.workers):
+                self.evaluate(executor, candidates[start:start + self.workers])
+                self.save_checkpoint()
+
+    def grid_search(self, values):
+        """Tries every combination of the given values for the three coefficients"""
+        self.run_candidates(list(itertools.product(values, repeat=3)))
+
+    def random_search(self, samples, low, high):
+        """Tries weights drawn uniformly from [low, high]; the draws are repeatable from the seed"""
+        rng = random.Random(self.seed)
+        candidates = [tuple(round(rng.uniform(low, high), 2) for _ in range(3)) for _ in range(samples)]
+        self.run_candidates(candidates)
+
+    def spsa_search(self, iterations, step_size=1.0, perturbation=0.5):
+        """Climbs the win rate with SPSA, starting from the reference weights"""
+        if self.spsa_state is None:
+            self.spsa_state = {'iteration': 0, 'theta': list(self.reference_weights)}
+        rng = random.Random(self.seed)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while self.spsa_state['iteration'] < iterations:
+                k = self.spsa_state['iteration']
+                theta = self.spsa_state['theta']
+                # Standard SPSA gain schedules
+                a_k = step_size / (k + 1 + iterations / 10) ** 0.602
+                c_k = perturbation / (k + 1) ** 0.101
+                # Re-seeding per iteration keeps the perturbations the same after a resume
+                rng.seed(self.seed + k)
+                delta = [rng.choice([-1, 1]) for _ in theta]
+                plus = tuple(round(max(0.0, t + c_k * d), 4) for t, d in zip(theta, delta))
+                minus = tuple(round(max(0.0, t - c_k * d), 4) for t, d in zip(theta, delta))
+                score_plus, score_minus = self.evaluate(executor, [plus, minus])
+                theta = [max(0.0, t + a_k * (score_plus - score_minus) / (2 * c_k * d))
+                         for t, d in zip(theta, delta)]
+                self.spsa_state = {'iteration': k + 1, 'theta': [round(t, 4) for t in theta]}
+                self.save_checkpoint()
+                print(f"Iteration {k + 1}: theta = {weights_key(self.spsa_state['theta'])}")
+            self.evaluate(executor, [tuple(self.spsa_state['theta'])])
+            self.save_checkpoint()
+
+    def print_best(self, count=5):
+        """Prints the strongest weights found so far"""
+        ranked = sorted(self.results.values(), key=lambda result: result['win_rate'], reverse=True)
+        print(f"Best weights against {weights_key(self.reference_weights)}:")
+        for result in ranked[:count]:
+            print(f"{weights_key(result['weights'])}: {result['wins']}/{result['games']} ({result['win_rate']:.1%})")
+
+
+#----------------------COMMAND LINE----------------------
+
+def main():
+    """Parses the tuning options and runs the chosen search"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("method", choices=["grid", "random", "spsa"])
+    parser.add_argument("--reference", type=parse_weights, default=DEFAULT_WEIGHTS,
+                        help="weights of the reference heuristic player (default 3,2,1)")
+    parser.add_argument("--games", type=int, default=100, help="games played per candidate")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use (default all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default="tune_checkpoint.json")
+    parser.add_argument("--values", default="0,1,2,3,4,5", help="grid values for each coefficient")
+    parser.add_argument("--samples", type=int, default=50, help="random search candidates")
+    parser.add_argument("--low", type=float, default=0.0)
+    parser.add_argument("--high", type=float, default=6.0)
+    parser.add_argument("--iterations", type=int, default=50, help="SPSA iterations")
+    args = parser.parse_args()
+
+    tuner = WeightTuner(args.reference, args.games, args.workers, args.seed, args.checkpoint)
+    tuner.load_checkpoint()
+    if args.method == "grid":
+        tuner.grid_search([float(value) for value in args.values.split(",")])
+    elif args.method == "random":
+        tuner.random_search(args.samples, args.low, args.high)
+    elif args.method == "spsa":
+        tuner.spsa_search(args.iterations)
+    tuner.print_best()
+
+
+if __name__ == "__main__":
+    main()